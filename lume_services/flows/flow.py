@@ -35,6 +35,9 @@ class MappedParameter(BaseModel):
     parent_task_name: str
     map_type: Literal["file", "db", "raw"] = "raw"
 
+    class Config:
+        frozen = True
+
 
 class RawMappedParameter(MappedParameter):
     """RawMappedParameters describe parameter mappings where the result of a task is
@@ -170,7 +173,8 @@ class Flow(BaseModel):
 
         # assign attributes
         self.prefect_flow = flow
-        self.task_slugs = {task.name: task.slug for task in flow.get_tasks()}
+        # iterate the flow's task set directly; get_tasks() copies it into a list
+        self.task_slugs = {task.name: task.slug for task in flow.tasks}
         self.parameters = {parameter.name: parameter for parameter in flow.parameters()}
         self.flow_id = flow_dict["flow_id"]
 
@@ -201,9 +205,7 @@ class Flow(BaseModel):
         self.parameters = {
             parameter.name: parameter for parameter in self.prefect_flow.parameters()
         }
-        self.task_slugs = {
-            task.name: task.slug for task in self.prefect_flow.get_tasks()
-        }
+        self.task_slugs = {task.name: task.slug for task in self.prefect_flow.tasks}
 
         return self.flow_id
 
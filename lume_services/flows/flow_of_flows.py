@@ -1,7 +1,9 @@
 import os
 import yaml
-from pydantic import root_validator
-from typing import get_args
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import Field, PrivateAttr, root_validator
+from typing import Dict, List, Set, Tuple, get_args
 from prefect.storage.docker import Docker
 from prefect.tasks.prefect import (
     create_flow_run,
@@ -24,12 +26,144 @@ from lume_services.config import Context
 from lume_services.services.scheduling import SchedulingService
 
 
+@inject
+def _get_scheduling_service(
+    scheduling_service: SchedulingService = Provide[Context.scheduling_service],
+) -> SchedulingService:
+    """Returns the injected scheduling service."""
+    return scheduling_service
+
+
+def _get_flow_edges(flows: Dict[str, Flow]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Validate mapped parameters against the composing flows and collect the edge
+    each one describes.
+
+    Args:
+        flows (Dict[str, Flow]): Map of flow name to loaded composing flow.
+
+    Returns:
+        Dict[str, List[Tuple[str, str, str]]]: Map of child flow name to
+            (parameter name, parent flow name, parent task slug) for each mapped
+            parameter.
+
+    Raises:
+        ParameterNotInFlowError: Mapped parameter is not a parameter of the flow.
+        ParentFlowNotInFlowsError: Parent flow is not among the composing flows.
+        TaskNotInFlowError: Parent task is not in the parent flow.
+
+    """
+    flow_names = list(flows.keys())
+    edges = {}
+    for flow_name, flow in flows.items():
+        if flow.mapped_parameters is None:
+            continue
+
+        flow_edges = []
+
+        parameters = flow.parameters
+        for parameter_name, parameter in flow.mapped_parameters.items():
+
+            # validate parameter is in flow spec
+            if parameter_name not in parameters:
+                raise ParameterNotInFlowError(parameter_name, flow_name)
+
+            # validate parent flow is included in listed flows
+            try:
+                parent_flow = flows[parameter.parent_flow_name]
+            except KeyError:
+                raise ParentFlowNotInFlowsError(
+                    parameter.parent_flow_name, flow_names
+                ) from None
+
+            # validate task is in the parent flow
+            try:
+                task_slug = parent_flow.task_slugs[parameter.parent_task_name]
+            except KeyError:
+                raise TaskNotInFlowError(
+                    parameter.parent_flow_name,
+                    parent_flow.project_name,
+                    parameter.parent_task_name,
+                ) from None
+
+            flow_edges.append((parameter_name, parameter.parent_flow_name, task_slug))
+
+        edges[flow_name] = flow_edges
+
+    return edges
+
+
+def _get_topological_order(
+    flow_names: List[str], upstream_flows: Dict[str, Set[str]]
+) -> List[str]:
+    """Order flows so that every flow follows the parent flows its parameters are
+    mapped from, using Kahn's algorithm. Independent flows keep their listed order.
+
+    Args:
+        flow_names (List[str]): Names of composing flows.
+        upstream_flows (Dict[str, Set[str]]): Map of child flow name to the names of
+            the parent flows its parameters are mapped from.
+
+    Returns:
+        List[str]: Flow names in topological order.
+
+    Raises:
+        ValueError: Mapped parameters form a cycle between flows.
+
+    """
+    children = {flow_name: [] for flow_name in flow_names}
+    in_degree = {}
+    for flow_name in flow_names:
+        parents = upstream_flows.get(flow_name, set())
+        in_degree[flow_name] = len(parents)
+        for parent in parents:
+            children[parent].append(flow_name)
+
+    queue = deque(flow_name for flow_name in flow_names if not in_degree[flow_name])
+    order = []
+    while queue:
+        flow_name = queue.popleft()
+        order.append(flow_name)
+        for child in children[flow_name]:
+            in_degree[child] -= 1
+            if not in_degree[child]:
+                queue.append(child)
+
+    if len(order) != len(flow_names):
+        raise ValueError(
+            "Mapped parameters form a cycle between flows: %s",
+            [flow_name for flow_name in flow_names if in_degree[flow_name]],
+        )
+
+    return order
+
+
 class FlowOfFlows(Flow):
-    composing_flows: dict
+    # reassignment would leave the derived graph below stale
+    composing_flows: dict = Field(..., allow_mutation=False)
+
+    # derived from the mapped parameters of the composing flows on construction
+    _edges: Dict[str, List[Tuple[str, str, str]]] = PrivateAttr(default_factory=dict)
+    _upstream_flows: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _flow_order: List[str] = PrivateAttr(default_factory=list)
 
     class Config:
         arbitrary_types_allowed = True
 
+    def __init__(self, **values):
+        super().__init__(**values)
+
+        # validate mapped parameters across flows and build the dependency graph
+        self._edges = _get_flow_edges(self.composing_flows)
+        self._upstream_flows = {
+            flow_name: {parent for _, parent, _ in flow_edges}
+            for flow_name, flow_edges in self._edges.items()
+        }
+
+        # parents are always composed before the flows mapping from them
+        self._flow_order = _get_topological_order(
+            list(self.composing_flows.keys()), self._upstream_flows
+        )
+
     @root_validator(pre=True)
     def validate(cls, values: dict):
         """Validate composing flow data against Prefect server."""
@@ -42,52 +176,48 @@ class FlowOfFlows(Flow):
         # validate composing flow existence
         composing_flows = values.get("composing_flows")
 
+        # already composed Flow objects are used as-is
         if isinstance(composing_flows, (dict,)):
-            pass
+            flows = composing_flows
 
         # iterate to create dict
         elif isinstance(composing_flows, (list,)):
+
+            # compose flow objects
             for flow in values["composing_flows"]:
+                if flow["name"] in flows:
+                    raise ValueError(
+                        "Flow %s listed more than once in composing flows.",
+                        flow["name"],
+                    )
 
-                # compose flow objects
-                flow_obj = Flow(
+                flows[flow["name"]] = Flow(
                     name=flow["name"],
                     project_name=flow["project_name"],
                     mapped_parameters=flow.get("mapped_parameters"),
                 )
 
-                # load Prefect parameters
-                if scheduling_service is not None:
-                    flow_obj.load_flow(scheduling_service=scheduling_service)
-                else:
-                    flow_obj.load_flow()
-
-                flows[flow["name"]] = flow_obj
-
-        # validate flow parameters
-        for flow_name, flow in flows.items():
-            if flow.mapped_parameters is not None:
-                for parameter_name, parameter in flow.mapped_parameters.items():
-
-                    # validate parameter is in flow spec
-                    parameter_obj = flow.parameters.get(parameter_name)
-                    if parameter_obj is None:
-                        raise ParameterNotInFlowError(parameter_name, flow_name)
-
-                    # validate parent flow is included in listed flows
-                    parent_flow = flows.get(parameter.parent_flow_name)
-                    if parent_flow is None:
-                        raise ParentFlowNotInFlowsError(
-                            parameter.parent_flow_name, list(flows.keys())
+            # resolve the injected service on this thread before dispatching loads, as
+            # the singleton provider is not thread-safe on first resolution
+            if scheduling_service is None:
+                scheduling_service = _get_scheduling_service()
+
+            # load Prefect parameters. Loads are independent calls to the backend, so
+            # fetch all flows concurrently. Backends must support concurrent load_flow
+            # calls.
+            if len(flows):
+                max_workers = min(16, len(flows))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            flow_obj.load_flow, scheduling_service=scheduling_service
                         )
+                        for flow_obj in flows.values()
+                    ]
 
-                    # validate task is in the parent flow
-                    task = parent_flow.task_slugs.get(parameter.parent_task_name)
-
-                    if task is None:
-                        raise TaskNotInFlowError(
-                            parameter.parent_flow_name, parameter.parent_task_name
-                        )
+                    # raise any errors encountered during load
+                    for future in futures:
+                        future.result()
 
         values["composing_flows"] = flows
 
@@ -131,7 +261,8 @@ class FlowOfFlows(Flow):
             flow_waits = {}
             params = {}
 
-            for i, (flow_name, flow) in enumerate(self.composing_flows.items()):
+            for flow_name in self._flow_order:
+                flow = self.composing_flows[flow_name]
 
                 # begin by creating parameters for all flow parameters
                 flow_params = {}
@@ -145,78 +276,61 @@ class FlowOfFlows(Flow):
                     # use original param name for flow config
                     flow_params[param_name] = param
 
-                # set up entry task
-                if i == 0:
-                    flow_run = create_flow_run(
-                        flow_id=flow.flow_id,
-                        parameters=flow_params,
-                        labels=flow.labels,
-                    )
+                # create references to parameters. Flows without mapped parameters
+                # have no edges and use their parameters directly.
+                for param_name, parent_flow_name, task_slug in self._edges.get(
+                    flow_name, []
+                ):
+                    mapped_param = flow.mapped_parameters[param_name]
 
-                # setup other tasks
-                elif i > 0:
+                    task_run_result = get_task_run_result(
+                        flow_runs[parent_flow_name], task_slug
+                    )
 
-                    # create references to parameters
-                    upstream_flows = set()
-                    if flow.mapped_parameters is not None:
+                    # raw results and file results use their values directly
+                    if mapped_param.map_type in ["raw", "file"]:
+                        flow.prefect_flow.replace(
+                            flow_params.pop(param_name), task_run_result
+                        )
 
-                        # update flow_params with mapping
-                        for param_name, mapped_param in flow.mapped_parameters.items():
-                            task_slug = self.composing_flows[
-                                mapped_param.parent_flow_name
-                            ].task_slugs[mapped_param.parent_task_name]
+                    # handle database results
+                    elif mapped_param.map_type == "db":
+                        load_db_result = LoadDBResult()
+                        db_result = load_db_result(
+                            task_run_result,
+                            attribute_index=mapped_param.attribute_index,
+                        )
+                        flow.prefect_flow.replace(
+                            flow_params.pop(param_name), db_result
+                        )
 
-                            task_run_result = get_task_run_result(
-                                flow_runs[mapped_param.parent_flow_name], task_slug
+                        # add db result parameters to the task and create edge
+                        for param in load_db_result.parameters.values():
+                            flow.prefect_flow.add_task(param)
+                            flow.prefect_flow.add_edge(
+                                param, load_db_result, mapped=True
                             )
 
-                            # raw results and file results use their values directly
-                            if mapped_param.map_type in ["raw", "file"]:
-                                flow.prefect_flow.replace(
-                                    flow_params.pop(param_name), task_run_result
-                                )
-
-                            # handle database results
-                            elif mapped_param.map_type == "db":
-                                load_db_result = LoadDBResult()
-                                db_result = load_db_result(
-                                    task_run_result,
-                                    attribute_index=mapped_param.attribute_index,
-                                )
-                                flow.prefect_flow.replace(
-                                    flow_params.pop(param_name), db_result
-                                )
-
-                                # add db result parameters to the task and create edge
-                                for param in load_db_result.parameters.values():
-                                    flow.prefect_flow.add_task(param)
-                                    flow.prefect_flow.add_edge(
-                                        param, load_db_result, mapped=True
-                                    )
-
-                            else:
-                                # should never reach if instantiating MappedParameter
-                                mapped_param_types = get_args(
-                                    MappedParameter.__fields__["map_type"].type_
-                                )
-                                raise ValueError(
-                                    f"Task type {mapped_param.map_type} not in task. \
-                                        Allowed types: {mapped_param_types}."
-                                )
-
-                            # add flow to upstream
-                            upstream_flows.add(mapped_param.parent_flow_name)
-
-                        # add creation of flow run to flow
-                        flow_run = create_flow_run(
-                            flow_id=flow.flow_id,
-                            parameters=flow_params,
-                            labels=flow.labels,
+                    else:
+                        # should never reach if instantiating MappedParameter
+                        mapped_param_types = get_args(
+                            MappedParameter.__fields__["map_type"].type_
+                        )
+                        raise ValueError(
+                            f"Task type {mapped_param.map_type} not in task. \
+                                Allowed types: {mapped_param_types}."
                         )
 
-                    # configure upstreams if any
-                    for upstream in upstream_flows:
-                        flow_run.set_upstream(flow_waits[upstream])
+                # add creation of flow run to flow
+                flow_run = create_flow_run(
+                    flow_id=flow.flow_id,
+                    parameters=flow_params,
+                    labels=flow.labels,
+                )
+
+                # configure upstreams if any
+                for upstream in self._upstream_flows.get(flow_name, ()):
+                    flow_run.set_upstream(flow_waits[upstream])
 
                 flow_wait = wait_for_flow_run(flow_run, raise_final_state=True)
                 flow_runs[flow_name] = flow_run
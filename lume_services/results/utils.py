@@ -1,5 +1,6 @@
 from .generic import Result
 from .impact import ImpactResult
+from functools import lru_cache
 from typing import Dict
 
 import logging
@@ -15,8 +16,10 @@ _ResultTypes = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_result_from_string(result_type_string: str) -> Result:
-    """Returns a LUME-model result type from a string import path.
+    """Returns a LUME-model result type from a string import path. Resolved types
+    are cached by import path.
 
     Args:
         result_type_string (str): Full import path of result type class.
@@ -122,7 +122,7 @@ class MountedFilesystem(LocalFilesystem):
             path (str): Path to validate
 
         """
-        print(path)
+        logger.debug("Checking path %s against mount %s", path, self.mount_path)
 
         if self.mount_alias in path:
             return path
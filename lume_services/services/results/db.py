@@ -33,11 +33,13 @@ class ResultsDB(ABC):
         """
 
     @abstractmethod
-    def insert_many(self, items: List[dict], **kwargs) -> List[str]:
-        """Insert many documents into the database.
+    def insert_many(self, collection: str, items: List[dict], **kwargs) -> List[str]:
+        """Insert many documents into a collection of the database.
 
         Args:
+            collection (str): Name of collection for saving documents
             items (List[dict]): List of dictionary representations of items
+            **kwargs: DB implementation specific fields
 
         Returns:
             List[str]: List of interted ids
@@ -175,12 +175,13 @@ class MongodbResultsDB(ResultsDB):
 
         return inserted_id
 
-    def insert_many(self, collection: str, items: List[dict]) -> List[str]:
+    def insert_many(self, collection: str, items: List[dict], **kwargs) -> List[str]:
         """Insert many documents into the database.
 
         Args:
             collection (str): Document type to query
             items (List[dict]): List of dictionary reps of documents to save to database
+            **kwargs: Keyword arguments passed to pymongo insert_many, e.g. ordered
 
         Returns:
             List[str]: List of saved document ids.
@@ -191,9 +192,9 @@ class MongodbResultsDB(ResultsDB):
         with self.client() as client:
             db = client[self.config.database]
             db_collection = db[collection]
-            inserted_ids = db_collection.insert_many(items).inserted_ids
+            inserted_ids = db_collection.insert_many(items, **kwargs).inserted_ids
 
-        return [inserted_id.str for inserted_id in inserted_ids]
+        return [str(inserted_id) for inserted_id in inserted_ids]
 
     def find(
         self, collection: str, query: dict = None, fields: List[str] = None
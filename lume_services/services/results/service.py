@@ -32,16 +32,34 @@ class ResultsDBService:
         return self._results_db.insert_one(**item, **kwargs)
 
     def insert_many(self, items: List[dict], **kwargs) -> List[str]:
-        """Insert many documents into the database.
+        """Insert many documents into the database. Items are grouped by collection
+        and each collection is written in a single batch.
 
         Args:
             items (List[dict]): List of dictionary representations of items
+            **kwargs: DB implementation specific fields
 
         Returns:
-            List[str]: List of interted ids
+            List[str]: List of interted ids, in the order of the passed items
 
         """
-        return self._results_db.insert_many(items, **kwargs)
+        # track each item's position so ids can be returned in input order
+        collection_items = {}
+        for index, item in enumerate(items):
+            item = dict(item)
+            collection = item.pop("collection")
+            collection_items.setdefault(collection, []).append((index, item))
+
+        inserted_ids = [None] * len(items)
+        for collection, indexed_items in collection_items.items():
+            indices, batch = zip(*indexed_items)
+            batch_ids = self._results_db.insert_many(
+                collection=collection, items=list(batch), **kwargs
+            )
+            for index, inserted_id in zip(indices, batch_ids):
+                inserted_ids[index] = inserted_id
+
+        return inserted_ids
 
     def find(self, *, query: dict, fields: List[str] = None, **kwargs) -> List[dict]:
         """Find a document based on a query.
@@ -1,6 +1,8 @@
 from prefect import Flow
-from pydantic import validator
+from prefect.engine import get_default_executor_class
+from prefect.executors import Executor, LocalExecutor
 from prefect.run_configs import LocalRun
+from pydantic import PrivateAttr, validator
 from typing import Optional, Dict, Any
 import logging
 import warnings
@@ -17,6 +19,10 @@ from lume_services.errors import (
 
 logger = logging.getLogger(__name__)
 
+# working directories already confirmed to exist, used to skip repeated filesystem
+# checks when constructing LocalRunConfig objects
+_validated_working_dirs = set()
+
 
 class LocalRunConfig(RunConfig):
     """Local run configuration. If no directory is found at the filepath passed as
@@ -38,9 +44,14 @@ class LocalRunConfig(RunConfig):
     @validator("working_dir", pre=True)
     def validate(cls, v):
         """Pydantic validator checking working directory existence"""
+        if v in _validated_working_dirs:
+            return v
+
         if not os.path.isdir(v):
             raise FileNotFoundError("No directory found at %s", v)
 
+        _validated_working_dirs.add(v)
+
         return v
 
     def build(self) -> LocalRun:
@@ -50,7 +61,11 @@ class LocalRunConfig(RunConfig):
             LocalRun
 
         """
-        return LocalRun(**self.dict(exclude_none=True))
+        # all fields are flat, so read values directly rather than using the
+        # recursive BaseModel.dict(exclude_none=True)
+        return LocalRun(
+            **{key: value for key, value in self.__dict__.items() if value is not None}
+        )
 
 
 class LocalBackend(Backend):
@@ -63,6 +78,27 @@ class LocalBackend(Backend):
 
     """
 
+    # executor reused across runs of flows that don't define their own
+    _executor: LocalExecutor = PrivateAttr(default_factory=LocalExecutor)
+
+    def _get_executor(self, flow: Flow) -> Optional[Executor]:
+        """Get the executor for a flow run. The shared LocalExecutor is only used when
+        the flow has no executor and LocalExecutor is the configured default, so that
+        a default configured with PREFECT__ENGINE__EXECUTOR__DEFAULT_CLASS is kept.
+
+        Args:
+            flow (Flow): Prefect flow to execute.
+
+        Returns:
+            Optional[Executor]: Executor passed to the flow run. If None, Prefect
+                uses the flow executor or the configured default.
+
+        """
+        if flow.executor is None and get_default_executor_class() is LocalExecutor:
+            return self._executor
+
+        return flow.executor
+
     def run(
         self,
         data: Dict[str, Any],
@@ -104,7 +140,7 @@ class LocalBackend(Backend):
 
         # apply run config
         flow.run_config = prefect_run_config
-        flow.run(parameters=data)
+        flow.run(parameters=data, executor=self._get_executor(flow))
 
     def run_and_return(
         self,
@@ -150,7 +186,7 @@ class LocalBackend(Backend):
         flow.run_config = prefect_run_config
 
         try:
-            flow_run = flow.run(parameters=data)
+            flow_run = flow.run(parameters=data, executor=self._get_executor(flow))
             if flow_run.is_failed():
                 logger.exception(flow_run.message)
                 raise FlowFailedError(
@@ -172,9 +208,6 @@ class LocalBackend(Backend):
         if result is None:
             raise EmptyResultError
 
-        task_to_slug_map = {task: slug for task, slug in flow.slugs.items()}
-        # slug_to_task_map = {slug: task for task, slug in flow.slugs.items()}
-
         # account for task slug
         if task_name is not None:
             # get tasks
@@ -186,7 +219,7 @@ class LocalBackend(Backend):
 
             results = []
             for task in tasks:
-                slug = task_to_slug_map.get(task)
+                slug = flow.slugs.get(task)
                 state = result[task]
                 if not state.is_successful():
                     raise TaskNotCompletedError(
@@ -207,9 +240,7 @@ class LocalBackend(Backend):
 
         # else return dict of task slug to value
         else:
-            return {
-                slug: result[task].result for task, slug in task_to_slug_map.items()
-            }
+            return {slug: result[task].result for task, slug in flow.slugs.items()}
 
     def create_project(self, *args, **kwargs) -> None:
         """Raise LocalBackendError for calls to register_flow server-type method.
@@ -1,5 +1,6 @@
 from abc import abstractproperty
 from datetime import timedelta
+import threading
 import warnings
 from typing import Dict, Any, List, Literal
 
@@ -24,6 +25,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_apply_lock = threading.Lock()
+
 
 class PrefectAgentConfig(BaseModel):
     host: str = "http://localhost"
@@ -61,18 +64,24 @@ class PrefectConfig(BaseModel):
     isolated: bool = False
 
     def apply(self):
-        prefect_config.update(
-            home_dir=self.home_dir, debug=self.debug, backend=self.backend
-        )
-        # must set endpoint because referenced by client
-        prefect_config.server.update(
-            endpoint=f"{self.server.host}:{self.server.host_port}", **self.server.dict()
-        )
-        prefect_config.server.ui.update(**self.ui.dict())
-        prefect_config.server.telemetry.update(**self.telemetry.dict())
-        # client requires api set
-        prefect_config.cloud.update(api=f"{self.server.host}:{self.server.host_port}")
-        save_backend(self.backend)
+        # the Prefect config and backend file are process-wide, so serialize updates
+        # from backends called concurrently, e.g. when loading composing flows
+        with _apply_lock:
+            prefect_config.update(
+                home_dir=self.home_dir, debug=self.debug, backend=self.backend
+            )
+            # must set endpoint because referenced by client
+            prefect_config.server.update(
+                endpoint=f"{self.server.host}:{self.server.host_port}",
+                **self.server.dict(),
+            )
+            prefect_config.server.ui.update(**self.ui.dict())
+            prefect_config.server.telemetry.update(**self.telemetry.dict())
+            # client requires api set
+            prefect_config.cloud.update(
+                api=f"{self.server.host}:{self.server.host_port}"
+            )
+            save_backend(self.backend)
         return prefect_config
 
 
@@ -209,9 +218,6 @@ class ServerBackend(Backend):
 
         """
 
-        flow_view = FlowView.from_flow_name(
-            flow_name, project_name=project_name, last_updated=True
-        )
         with prefect.context(config=self.config.apply()):
             flow_view = FlowView.from_flow_name(
                 flow_name, project_name=project_name, last_updated=True
@@ -0,0 +1,121 @@
+import pytest
+from prefect import Flow as PrefectFlow, Parameter, task
+
+from lume_services.flows.flow import Flow
+from lume_services.flows.flow_of_flows import FlowOfFlows, _get_topological_order
+
+
+@task
+def return_value(value):
+    return value
+
+
+def build_flow(name, mapped_parameters=None):
+    """Build a composing flow from a local Prefect flow, without loading from a
+    Prefect server.
+
+    """
+    with PrefectFlow(name) as prefect_flow:
+        value = Parameter("value")
+        return_value(value)
+
+    return Flow(
+        name=name,
+        project_name="test",
+        flow_id=f"{name}_id",
+        prefect_flow=prefect_flow,
+        parameters={
+            parameter.name: parameter for parameter in prefect_flow.parameters()
+        },
+        task_slugs={
+            flow_task.name: slug for flow_task, slug in prefect_flow.slugs.items()
+        },
+        mapped_parameters=mapped_parameters,
+        image="placeholder_image_tag",
+    )
+
+
+def mapped_value(parent_flow_name):
+    return {
+        "value": {
+            "parent_flow_name": parent_flow_name,
+            "parent_task_name": "return_value",
+        }
+    }
+
+
+class TestTopologicalOrder:
+    def test_out_of_order_listing(self):
+        order = _get_topological_order(["c", "a", "b"], {"c": {"a", "b"}, "b": {"a"}})
+        assert order == ["a", "b", "c"]
+
+    def test_independent_roots_keep_order(self):
+        order = _get_topological_order(["b", "c", "a"], {})
+        assert order == ["b", "c", "a"]
+
+    def test_cycle(self):
+        with pytest.raises(ValueError):
+            _get_topological_order(["a", "b"], {"a": {"b"}, "b": {"a"}})
+
+
+class TestFlowOfFlowsCompose:
+    def test_cycle_fails_construction(self):
+        with pytest.raises(ValueError):
+            FlowOfFlows(
+                name="flow_of_flows",
+                project_name="test",
+                image="placeholder_image_tag",
+                composing_flows={
+                    "a": build_flow("a", mapped_parameters=mapped_value("b")),
+                    "b": build_flow("b", mapped_parameters=mapped_value("a")),
+                },
+            )
+
+    def test_compose_out_of_order(self):
+        flow_of_flows = FlowOfFlows(
+            name="flow_of_flows",
+            project_name="test",
+            image="placeholder_image_tag",
+            composing_flows={
+                "b": build_flow("b", mapped_parameters=mapped_value("a")),
+                "a": build_flow("a"),
+            },
+        )
+        composed_flow = flow_of_flows.compose(
+            image_name="placeholder_image", local=True
+        )
+        assert len(composed_flow.get_tasks(name="create_flow_run")) == 2
+
+    def test_compose_downstream_flow_without_mapped_parameters(self):
+        flow_of_flows = FlowOfFlows(
+            name="flow_of_flows",
+            project_name="test",
+            image="placeholder_image_tag",
+            composing_flows={
+                "a": build_flow("a"),
+                "b": build_flow("b", mapped_parameters=mapped_value("a")),
+                "c": build_flow("c"),
+            },
+        )
+        composed_flow = flow_of_flows.compose(
+            image_name="placeholder_image", local=True
+        )
+
+        # every composing flow gets its own flow run
+        assert len(composed_flow.get_tasks(name="create_flow_run")) == 3
+
+    def test_composing_flows_reassignment(self):
+        flow_of_flows = FlowOfFlows(
+            name="flow_of_flows",
+            project_name="test",
+            image="placeholder_image_tag",
+            composing_flows={"a": build_flow("a")},
+        )
+
+        with pytest.raises(TypeError):
+            flow_of_flows.composing_flows = {
+                "a": build_flow("a"),
+                "c": build_flow("c", mapped_parameters=mapped_value("zz")),
+            }
+
+        assert list(flow_of_flows.composing_flows.keys()) == ["a"]
@@ -16,20 +16,24 @@ from lume_services.files import HDF5File, ImageFile
 from lume_services.tests.files import SAMPLE_IMPACT_ARCHIVE, SAMPLE_IMAGE_FILE
 from lume_services.services.results import MongodbResultsDBConfig, MongodbResultsDB
 
+# shared read-only array used across result fixtures
+NUMPY_ARRAY = np.array([1, 2, 3, 4, 5])
+NUMPY_ARRAY.setflags(write=False)
 
-@pytest.fixture(scope="module", autouse=True)
-def impact_result(results_db_service):
+
+@pytest.fixture(scope="module")
+def impact_result():
     result = ImpactResult(
         project_name="impact",
         flow_id="test_flow_id_impact",
         inputs={
             "input1": 2.0,
-            "input2": np.array([1, 2, 3, 4, 5]),
+            "input2": NUMPY_ARRAY,
             "input3": "my_file.txt",
         },
         outputs={
             "output1": 2.0,
-            "output2": np.array([1, 2, 3, 4, 5]),
+            "output2": NUMPY_ARRAY,
             "output3": "my_file.txt",
         },
         plot_file=ImageFile(filename=SAMPLE_IMAGE_FILE, filesystem_identifier="local"),
@@ -37,11 +41,18 @@ def impact_result(results_db_service):
         pv_collection_isotime=datetime.now(),
         config={"config1": 1, "config2": 2},
     )
+    return result
+
+
+@pytest.fixture(scope="module")
+def impact_db_dict(impact_result):
+    return impact_result.get_db_dict()
+
 
-    rep = result.get_db_dict()
-    insert_rep = results_db_service.insert_one(rep)
+@pytest.fixture(scope="module", autouse=True)
+def impact_result_insert(impact_db_dict, results_db_service):
+    insert_rep = results_db_service.insert_one(impact_db_dict)
     assert insert_rep is not None
-    return result
 
 
 def check_impact_result_equal(impact_result, new_impact_obj):
@@ -64,22 +75,29 @@ def check_impact_result_equal(impact_result, new_impact_obj):
     assert impact_result.config == new_impact_obj.config
 
 
-@pytest.fixture(scope="module", autouse=True)
-def generic_result(results_db_service):
+@pytest.fixture(scope="module")
+def generic_result():
     result = Result(
         project_name="generic",
         flow_id="test_flow_id",
-        inputs={"input1": 2.0, "input2": np.array([1, 2, 3, 4, 5])},
+        inputs={"input1": 2.0, "input2": NUMPY_ARRAY},
         outputs={
             "output1": 2.0,
             "output2": pd.DataFrame({"x": [0, 1, 2], "y": [1, 2, 3]}),
         },
     )
+    return result
+
 
-    rep = result.get_db_dict()
-    insert_rep = results_db_service.insert_one(rep)
+@pytest.fixture(scope="module")
+def generic_db_dict(generic_result):
+    return generic_result.get_db_dict()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def generic_result_insert(generic_db_dict, results_db_service):
+    insert_rep = results_db_service.insert_one(generic_db_dict)
     assert insert_rep is not None
-    return result
 
 
 def check_generic_result_equal(generic_result, new_generic_obj):
@@ -145,6 +163,13 @@ def test_get_result_from_string(string, result_class_target):
     assert result_type == result_class_target
 
 
+def test_get_result_from_string_cached():
+    get_result_from_string("lume_services.results.generic.Result")
+    hits = get_result_from_string.cache_info().hits
+    get_result_from_string("lume_services.results.generic.Result")
+    assert get_result_from_string.cache_info().hits == hits + 1
+
+
 class TestGenericResult:
     def test_create_generic_result_from_alias(self):
         Result(
@@ -174,8 +199,8 @@ class TestImpactResult:
         json_rep = impact_result.json()
         ImpactResult.parse_raw(json_rep)
 
-    def test_from_dict(self, impact_result):
-        ImpactResult(**impact_result.get_db_dict())
+    def test_from_dict(self, impact_db_dict):
+        ImpactResult(**impact_db_dict)
 
     def test_load_image(self, impact_result, file_service):
         image = impact_result.plot_file.read(file_service=file_service)
@@ -209,16 +234,16 @@ class TestMongodbResultsDB:
 
 class TestResultsDBService:
     @pytest.mark.skip("Indices not created at present.")
-    def test_duplicate_generic_insert_fail(self, generic_result, results_db_service):
+    def test_duplicate_generic_insert_fail(self, generic_db_dict, results_db_service):
         # confirm duplicate raises error
         with pytest.raises(DuplicateKeyError):
-            results_db_service.insert_one(generic_result.get_db_dict())
+            results_db_service.insert_one(generic_db_dict)
 
     @pytest.mark.skip("Indices not created at present.")
-    def test_duplicate_impact_insert_fail(self, impact_result, results_db_service):
+    def test_duplicate_impact_insert_fail(self, impact_db_dict, results_db_service):
         # confirm duplicate raises error
         with pytest.raises(DuplicateKeyError):
-            results_db_service.insert_one(impact_result.get_db_dict())
+            results_db_service.insert_one(impact_db_dict)
 
     def test_generic_result_query(self, results_db_service, generic_result):
         query = {
@@ -256,6 +281,27 @@ class TestResultsDBService:
         res = results_db_service.find_all(collection=generic_result.project_name)
         assert isinstance(res, list)
 
+    def test_insert_many(self, results_db_service):
+        items = [
+            Result(
+                project_name=project_name,
+                flow_id=f"test_insert_many_{i}",
+                inputs={"input1": float(i)},
+                outputs={"output1": float(i)},
+            ).get_db_dict()
+            for i, project_name in enumerate(
+                ["insert_many_a", "insert_many_b", "insert_many_a", "insert_many_b"]
+            )
+        ]
+        inserted_ids = results_db_service.insert_many(items, ordered=False)
+
+        # ids are returned in the order of the passed items
+        for item, inserted_id in zip(items, inserted_ids):
+            res = results_db_service.find(
+                collection=item["collection"], query={"flow_id": item["flow_id"]}
+            )
+            assert str(res[0]["_id"]) == inserted_id
+
 
 class TestResultsInsertMethods:
     @pytest.fixture(scope="class", autouse=True)
@@ -278,7 +324,7 @@ class TestResultsInsertMethods:
             flow_id="test_flow_impact_id2",
             inputs={
                 "input1": 2.0,
-                "input2": np.array([1, 2, 3, 4, 5]),
+                "input2": NUMPY_ARRAY,
                 "input3": "my_file.txt",
             },
             outputs={